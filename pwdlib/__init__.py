@@ -2,6 +2,7 @@
 
 __version__ = "0.3.0"
 
+from ._executor import HashExecutor, Priority, PriorityStats
 from ._hash import PasswordHash
 
-__all__ = ["PasswordHash"]
+__all__ = ["HashExecutor", "PasswordHash", "Priority", "PriorityStats"]
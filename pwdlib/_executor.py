@@ -0,0 +1,318 @@
+import collections
+import collections.abc
+import concurrent.futures
+import dataclasses
+import enum
+import os
+import threading
+import time
+import typing
+
+from . import exceptions
+
+_T = typing.TypeVar("_T")
+
+_LATENCY_WINDOW = 1024
+
+
+class Priority(enum.IntEnum):
+    """
+    Priority classes for hashing work, from the most to the least urgent.
+    """
+
+    INTERACTIVE = 0
+    """Latency-critical work, like verifying a password during a login."""
+
+    SIGNUP = 1
+    """Hashing a new password, like during a signup or a password change."""
+
+    REHASH = 2
+    """Upgrading an outdated hash after a successful verification."""
+
+    BATCH = 3
+    """Background work, like bulk migrations."""
+
+
+DEFAULT_WEIGHTS: collections.abc.Mapping[Priority, int] = {
+    Priority.SIGNUP: 4,
+    Priority.REHASH: 2,
+    Priority.BATCH: 1,
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class PriorityStats:
+    """
+    Snapshot of the statistics of a priority class.
+
+    Times are expressed in seconds. Latency percentiles are computed
+    over the most recent completed tasks.
+    """
+
+    queue_depth: int
+    running: int
+    submitted: int
+    completed: int
+    wait_time_avg: float
+    wait_time_max: float
+    latency_avg: float
+    latency_max: float
+    latency_p99: float
+
+
+@dataclasses.dataclass
+class _PriorityCounters:
+    running: int = 0
+    submitted: int = 0
+    completed: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    latencies: collections.deque[float] = dataclasses.field(
+        default_factory=lambda: collections.deque(maxlen=_LATENCY_WINDOW)
+    )
+
+
+@dataclasses.dataclass
+class _Task:
+    priority: Priority
+    future: concurrent.futures.Future[typing.Any]
+    fn: collections.abc.Callable[..., typing.Any]
+    args: tuple[typing.Any, ...]
+    enqueued_at: float
+
+
+class HashExecutor:
+    """
+    Runs hashing work on a shared pool of worker threads, scheduling it by priority.
+
+    `Priority.INTERACTIVE` tasks always run ahead of the other classes, which share
+    the remaining capacity according to their weights. A class that has pending work
+    but hasn't been served for `max_wait` seconds gets the next free worker,
+    so lower classes can't starve under a sustained interactive load.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        weights: collections.abc.Mapping[Priority, int] | None = None,
+        max_wait: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            max_workers: The number of worker threads.
+                Defaults to the number of CPUs.
+            weights: The relative share of the capacity left by
+                `Priority.INTERACTIVE` tasks given to each other class.
+                Unspecified classes use `DEFAULT_WEIGHTS`.
+            max_wait: The maximum time, in seconds, a class with pending work
+                can go without being served.
+
+        Raises:
+            AssertionError: If the number of workers, a weight or `max_wait` is invalid.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        assert max_workers > 0, "max_workers must be greater than 0."
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        assert Priority.INTERACTIVE not in weights, (
+            "INTERACTIVE is always scheduled first and can't have a weight."
+        )
+        assert all(weight > 0 for weight in weights.values()), (
+            "Weights must be greater than 0."
+        )
+        assert max_wait > 0, "max_wait must be greater than 0."
+
+        self.max_workers = max_workers
+        self.weights = weights
+        self.max_wait = max_wait
+
+        self._condition = threading.Condition()
+        self._queues: dict[Priority, collections.deque[_Task]] = {
+            priority: collections.deque() for priority in Priority
+        }
+        self._counters = {priority: _PriorityCounters() for priority in Priority}
+        self._last_served = {priority: 0.0 for priority in Priority}
+        self._passes = {priority: 0.0 for priority in weights}
+        self._virtual_time = 0.0
+        self._pending = 0
+        self._workers: list[threading.Thread] = []
+        self._shutdown = False
+
+    def __enter__(self) -> "HashExecutor":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.shutdown()
+
+    def submit(
+        self,
+        priority: Priority,
+        fn: collections.abc.Callable[..., _T],
+        /,
+        *args: typing.Any,
+    ) -> concurrent.futures.Future[_T]:
+        """
+        Schedules a callable to be run with the given priority.
+
+        Args:
+            priority: The priority class of the task.
+            fn: The callable to run.
+            *args: The positional arguments to pass to the callable.
+
+        Returns:
+            A future holding the result of the callable.
+
+        Raises:
+            exceptions.ExecutorShutdownError: If the executor has been shut down.
+        """
+        priority = Priority(priority)
+        future: concurrent.futures.Future[_T] = concurrent.futures.Future()
+        with self._condition:
+            if self._shutdown:
+                raise exceptions.ExecutorShutdownError()
+            now = time.monotonic()
+            queue = self._queues[priority]
+            if not queue:
+                self._last_served[priority] = now
+                if priority in self._passes:
+                    self._passes[priority] = max(
+                        self._passes[priority], self._virtual_time
+                    )
+            queue.append(_Task(priority, future, fn, args, now))
+            self._pending += 1
+            self._counters[priority].submitted += 1
+            if len(self._workers) < self.max_workers:
+                self._start_worker()
+            self._condition.notify()
+        return future
+
+    def stats(self) -> dict[Priority, PriorityStats]:
+        """
+        Returns a snapshot of the statistics of each priority class.
+        """
+        with self._condition:
+            return {
+                priority: self._snapshot(priority, counters)
+                for priority, counters in self._counters.items()
+            }
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stops accepting new tasks and stops the workers once the queues are drained.
+
+        Args:
+            wait: Whether to block until all the workers have exited.
+            cancel_futures: Whether to cancel the tasks that haven't started yet.
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for queue in self._queues.values():
+                    while queue:
+                        queue.popleft().future.cancel()
+                self._pending = 0
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(
+            target=self._work,
+            name=f"pwdlib-hash-{len(self._workers)}",
+            daemon=True,
+        )
+        worker.start()
+        self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending == 0 and not self._shutdown:
+                    self._condition.wait()
+                if self._pending == 0:
+                    return
+                task = self._next_task()
+                counters = self._counters[task.priority]
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+                started_at = time.monotonic()
+                wait_time = started_at - task.enqueued_at
+                counters.running += 1
+                counters.wait_time_total += wait_time
+                counters.wait_time_max = max(counters.wait_time_max, wait_time)
+
+            try:
+                result = task.fn(*task.args)
+            except BaseException as e:
+                task.future.set_exception(e)
+            else:
+                task.future.set_result(result)
+
+            with self._condition:
+                latency = time.monotonic() - task.enqueued_at
+                counters.running -= 1
+                counters.completed += 1
+                counters.latency_total += latency
+                counters.latency_max = max(counters.latency_max, latency)
+                counters.latencies.append(latency)
+
+    def _next_task(self) -> _Task:
+        now = time.monotonic()
+        priority = self._starved_priority(now)
+        if priority is None:
+            if self._queues[Priority.INTERACTIVE]:
+                priority = Priority.INTERACTIVE
+            else:
+                priority = min(
+                    (p for p in self._passes if self._queues[p]),
+                    key=lambda p: (self._passes[p], p),
+                )
+        if priority in self._passes:
+            self._virtual_time = self._passes[priority]
+            self._passes[priority] += 1 / self.weights[priority]
+        self._last_served[priority] = now
+        self._pending -= 1
+        return self._queues[priority].popleft()
+
+    def _starved_priority(self, now: float) -> Priority | None:
+        starved = [
+            (max(queue[0].enqueued_at, self._last_served[priority]), priority)
+            for priority, queue in self._queues.items()
+            if queue
+        ]
+        if not starved:
+            return None
+        since, priority = min(starved)
+        return priority if now - since >= self.max_wait else None
+
+    def _snapshot(
+        self, priority: Priority, counters: _PriorityCounters
+    ) -> PriorityStats:
+        started = counters.completed + counters.running
+        latencies = sorted(counters.latencies)
+        return PriorityStats(
+            queue_depth=len(self._queues[priority]),
+            running=counters.running,
+            submitted=counters.submitted,
+            completed=counters.completed,
+            wait_time_avg=counters.wait_time_total / started if started else 0.0,
+            wait_time_max=counters.wait_time_max,
+            latency_avg=(
+                counters.latency_total / counters.completed
+                if counters.completed
+                else 0.0
+            ),
+            latency_max=counters.latency_max,
+            latency_p99=(
+                latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                if latencies
+                else 0.0
+            ),
+        )
+
+
+__all__ = ["DEFAULT_WEIGHTS", "HashExecutor", "Priority", "PriorityStats"]
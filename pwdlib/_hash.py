@@ -1,19 +1,32 @@
+import asyncio
 import collections.abc
+import typing
 
 from . import exceptions
+from ._executor import HashExecutor, Priority
 from .hashers import HasherProtocol
 from .hashers.base import validate_str_or_bytes
 
+_T = typing.TypeVar("_T")
+
 
 class PasswordHash:
     """
     Represents a password hashing utility.
     """
 
-    def __init__(self, hashers: collections.abc.Sequence[HasherProtocol]) -> None:
+    def __init__(
+        self,
+        hashers: collections.abc.Sequence[HasherProtocol],
+        *,
+        executor: HashExecutor | None = None,
+    ) -> None:
         """
         Args:
             hashers: A sequence of hashers to be used for password hashing.
+            executor: An optional executor scheduling the hashing work by priority.
+                If not set, the work runs in the calling thread
+                and the priorities are ignored.
 
         Raises:
             AssertionError: If no hashers are specified.
@@ -21,6 +34,7 @@ class PasswordHash:
         assert len(hashers) > 0, "You must specify at least one hasher."
         self.hashers = hashers
         self.current_hasher = hashers[0]
+        self.executor = executor
 
     @classmethod
     def recommended(cls) -> "PasswordHash":
@@ -39,13 +53,20 @@ class PasswordHash:
 
         return cls((Argon2Hasher(),))
 
-    def hash(self, password: str | bytes, *, salt: bytes | None = None) -> str:
+    def hash(
+        self,
+        password: str | bytes,
+        *,
+        salt: bytes | None = None,
+        priority: Priority = Priority.SIGNUP,
+    ) -> str:
         """
         Hashes a password using the current hasher.
 
         Args:
             password: The password to be hashed.
             salt: The salt to be used for hashing. Defaults to None.
+            priority: The priority class of the work. Defaults to `Priority.SIGNUP`.
 
         Returns:
             The hashed password.
@@ -54,15 +75,23 @@ class PasswordHash:
             >>> hash = password_hash.hash("herminetincture")
         """
         validate_str_or_bytes(password, "password")
-        return self.current_hasher.hash(password, salt=salt)
+        return self._run(priority, self._hash, password, salt)
 
-    def verify(self, password: str | bytes, hash: str | bytes) -> bool:
+    def verify(
+        self,
+        password: str | bytes,
+        hash: str | bytes,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> bool:
         """
         Verifies if a password matches a given hash.
 
         Args:
             password: The password to be checked.
             hash: The hash to be verified.
+            priority: The priority class of the work.
+                Defaults to `Priority.INTERACTIVE`.
 
         Returns:
             True if the password matches the hash, False otherwise.
@@ -79,13 +108,16 @@ class PasswordHash:
         """
         validate_str_or_bytes(password, "password")
         validate_str_or_bytes(hash, "hash")
-        for hasher in self.hashers:
-            if hasher.identify(hash):
-                return hasher.verify(password, hash)
-        raise exceptions.UnknownHashError(hash)
+        hasher = self._identify(hash)
+        return self._run(priority, hasher.verify, password, hash)
 
     def verify_and_update(
-        self, password: str | bytes, hash: str | bytes
+        self,
+        password: str | bytes,
+        hash: str | bytes,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
+        rehash_priority: Priority = Priority.REHASH,
     ) -> tuple[bool, str | None]:
         """
         Verifies if a password matches a given hash and updates the hash if necessary.
@@ -93,6 +125,10 @@ class PasswordHash:
         Args:
             password: The password to be checked.
             hash: The hash to be verified.
+            priority: The priority class of the verification.
+                Defaults to `Priority.INTERACTIVE`.
+            rehash_priority: The priority class of the hash update.
+                Defaults to `Priority.REHASH`.
 
         Returns:
             A tuple containing a boolean indicating if the password matches the hash,
@@ -106,13 +142,209 @@ class PasswordHash:
         """
         validate_str_or_bytes(password, "password")
         validate_str_or_bytes(hash, "hash")
+        hasher = self._identify(hash)
+        if not self._run(priority, hasher.verify, password, hash):
+            return False, None
+        updated_hash: str | None = None
+        if self._needs_update(hasher, hash):
+            updated_hash = self._run(rehash_priority, self._hash, password, None)
+        return True, updated_hash
+
+    async def ahash(
+        self,
+        password: str | bytes,
+        *,
+        salt: bytes | None = None,
+        priority: Priority = Priority.SIGNUP,
+    ) -> str:
+        """
+        Hashes a password using the current hasher, without blocking the event loop.
+
+        Args:
+            password: The password to be hashed.
+            salt: The salt to be used for hashing. Defaults to None.
+            priority: The priority class of the work. Defaults to `Priority.SIGNUP`.
+
+        Returns:
+            The hashed password.
+
+        Examples:
+            >>> hash = await password_hash.ahash("herminetincture")
+        """
+        validate_str_or_bytes(password, "password")
+        return await self._arun(priority, self._hash, password, salt)
+
+    async def averify(
+        self,
+        password: str | bytes,
+        hash: str | bytes,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> bool:
+        """
+        Verifies if a password matches a given hash, without blocking the event loop.
+
+        Args:
+            password: The password to be checked.
+            hash: The hash to be verified.
+            priority: The priority class of the work.
+                Defaults to `Priority.INTERACTIVE`.
+
+        Returns:
+            True if the password matches the hash, False otherwise.
+
+        Raises:
+            exceptions.UnknownHashError: If the hash is not recognized by any of the hashers.
+
+        Examples:
+            >>> await password_hash.averify("herminetincture", hash)
+            True
+        """
+        validate_str_or_bytes(password, "password")
+        validate_str_or_bytes(hash, "hash")
+        hasher = self._identify(hash)
+        return await self._arun(priority, hasher.verify, password, hash)
+
+    async def averify_and_update(
+        self,
+        password: str | bytes,
+        hash: str | bytes,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
+        rehash_priority: Priority = Priority.REHASH,
+    ) -> tuple[bool, str | None]:
+        """
+        Verifies if a password matches a given hash and updates the hash if necessary,
+        without blocking the event loop.
+
+        Args:
+            password: The password to be checked.
+            hash: The hash to be verified.
+            priority: The priority class of the verification.
+                Defaults to `Priority.INTERACTIVE`.
+            rehash_priority: The priority class of the hash update.
+                Defaults to `Priority.REHASH`.
+
+        Returns:
+            A tuple containing a boolean indicating if the password matches the hash,
+                and an updated hash if the current hasher or the hash itself needs to be updated.
+
+        Raises:
+            exceptions.UnknownHashError: If the hash is not recognized by any of the hashers.
+
+        Examples:
+            >>> valid, updated_hash = await password_hash.averify_and_update("herminetincture", hash)
+        """
+        validate_str_or_bytes(password, "password")
+        validate_str_or_bytes(hash, "hash")
+        hasher = self._identify(hash)
+        if not await self._arun(priority, hasher.verify, password, hash):
+            return False, None
+        updated_hash: str | None = None
+        if self._needs_update(hasher, hash):
+            updated_hash = await self._arun(rehash_priority, self._hash, password, None)
+        return True, updated_hash
+
+    def hash_many(
+        self,
+        passwords: collections.abc.Iterable[str | bytes],
+        *,
+        priority: Priority = Priority.BATCH,
+    ) -> list[str]:
+        """
+        Hashes several passwords using the current hasher.
+
+        With an executor, the passwords are hashed concurrently.
+
+        Args:
+            passwords: The passwords to be hashed.
+            priority: The priority class of the work. Defaults to `Priority.BATCH`.
+
+        Returns:
+            The hashed passwords, in the same order.
+
+        Examples:
+            >>> hashes = password_hash.hash_many(["herminetincture", "bilberrycrumble"])
+        """
+        passwords = list(passwords)
+        for password in passwords:
+            validate_str_or_bytes(password, "password")
+        return self._run_many(
+            priority, [(self._hash, (password, None)) for password in passwords]
+        )
+
+    def verify_many(
+        self,
+        credentials: collections.abc.Iterable[tuple[str | bytes, str | bytes]],
+        *,
+        priority: Priority = Priority.BATCH,
+    ) -> list[bool]:
+        """
+        Verifies several passwords against their hash.
+
+        With an executor, the passwords are verified concurrently.
+
+        Args:
+            credentials: The pairs of password and hash to be verified.
+            priority: The priority class of the work. Defaults to `Priority.BATCH`.
+
+        Returns:
+            For each pair, True if the password matches the hash, False otherwise.
+
+        Raises:
+            exceptions.UnknownHashError: If a hash is not recognized by any of the hashers.
+
+        Examples:
+            >>> password_hash.verify_many([("herminetincture", hash)])
+            [True]
+        """
+        calls: list[tuple[collections.abc.Callable[..., bool], tuple]] = []
+        for password, hash in credentials:
+            validate_str_or_bytes(password, "password")
+            validate_str_or_bytes(hash, "hash")
+            calls.append((self._identify(hash).verify, (password, hash)))
+        return self._run_many(priority, calls)
+
+    def _hash(self, password: str | bytes, salt: bytes | None) -> str:
+        return self.current_hasher.hash(password, salt=salt)
+
+    def _identify(self, hash: str | bytes) -> HasherProtocol:
         for hasher in self.hashers:
             if hasher.identify(hash):
-                if not hasher.verify(password, hash):
-                    return False, None
-                else:
-                    updated_hash: str | None = None
-                    if hasher != self.current_hasher or hasher.check_needs_rehash(hash):
-                        updated_hash = self.current_hasher.hash(password)
-                    return True, updated_hash
+                return hasher
         raise exceptions.UnknownHashError(hash)
+
+    def _needs_update(self, hasher: HasherProtocol, hash: str | bytes) -> bool:
+        return hasher != self.current_hasher or hasher.check_needs_rehash(hash)
+
+    def _run(
+        self,
+        priority: Priority,
+        fn: collections.abc.Callable[..., _T],
+        *args: typing.Any,
+    ) -> _T:
+        if self.executor is None:
+            return fn(*args)
+        return self.executor.submit(priority, fn, *args).result()
+
+    async def _arun(
+        self,
+        priority: Priority,
+        fn: collections.abc.Callable[..., _T],
+        *args: typing.Any,
+    ) -> _T:
+        if self.executor is None:
+            return await asyncio.to_thread(fn, *args)
+        return await asyncio.wrap_future(self.executor.submit(priority, fn, *args))
+
+    def _run_many(
+        self,
+        priority: Priority,
+        calls: collections.abc.Sequence[
+            tuple[collections.abc.Callable[..., _T], tuple]
+        ],
+    ) -> list[_T]:
+        if self.executor is None:
+            return [fn(*args) for fn, args in calls]
+        futures = [self.executor.submit(priority, fn, *args) for fn, args in calls]
+        return [future.result() for future in futures]
@@ -50,3 +50,12 @@ class UnknownHashError(PwdlibError):
             "Make sure it's valid and that its corresponding hasher is enabled."
         )
         super().__init__(message)
+
+
+class ExecutorShutdownError(PwdlibError):
+    """
+    Error raised when work is submitted to a hash executor that has been shut down.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("Can't schedule new work after the executor was shut down.")
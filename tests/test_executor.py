@@ -0,0 +1,138 @@
+import collections.abc
+import threading
+import time
+
+import pytest
+
+from pwdlib import HashExecutor, Priority, exceptions
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.order: list[str] = []
+
+    def block(self) -> None:
+        self.gate.wait()
+
+    def record(self, name: str) -> str:
+        self.order.append(name)
+        return name
+
+
+@pytest.fixture
+def executor() -> collections.abc.Iterator[HashExecutor]:
+    executor = HashExecutor(1, max_wait=60)
+    yield executor
+    executor.shutdown(cancel_futures=True)
+
+
+def test_submit_result(executor: HashExecutor) -> None:
+    assert executor.submit(Priority.INTERACTIVE, pow, 2, 10).result() == 1024
+
+
+def test_submit_exception(executor: HashExecutor) -> None:
+    future = executor.submit(Priority.BATCH, int, "INVALID")
+    with pytest.raises(ValueError):
+        future.result()
+
+
+def test_interactive_runs_first(executor: HashExecutor) -> None:
+    recorder = _Recorder()
+    executor.submit(Priority.BATCH, recorder.block)
+    futures = [
+        executor.submit(Priority.BATCH, recorder.record, "batch"),
+        executor.submit(Priority.REHASH, recorder.record, "rehash"),
+        executor.submit(Priority.SIGNUP, recorder.record, "signup"),
+        executor.submit(Priority.INTERACTIVE, recorder.record, "interactive"),
+    ]
+    recorder.gate.set()
+    for future in futures:
+        future.result()
+    assert recorder.order[0] == "interactive"
+
+
+def test_weighted_share() -> None:
+    recorder = _Recorder()
+    with HashExecutor(
+        1, weights={Priority.SIGNUP: 3, Priority.BATCH: 1}, max_wait=60
+    ) as executor:
+        executor.submit(Priority.INTERACTIVE, recorder.block)
+        futures = [
+            executor.submit(priority, recorder.record, priority.name)
+            for priority in [Priority.BATCH, Priority.SIGNUP] * 8
+        ]
+        recorder.gate.set()
+        for future in futures:
+            future.result()
+    assert recorder.order[:8].count("SIGNUP") == 6
+
+
+def test_starvation_protection() -> None:
+    recorder = _Recorder()
+    with HashExecutor(1, max_wait=0.05) as executor:
+        executor.submit(Priority.INTERACTIVE, recorder.block)
+        batch_future = executor.submit(Priority.BATCH, recorder.record, "batch")
+        time.sleep(0.1)
+        interactive_future = executor.submit(
+            Priority.INTERACTIVE, recorder.record, "interactive"
+        )
+        recorder.gate.set()
+        batch_future.result()
+        interactive_future.result()
+    assert recorder.order == ["batch", "interactive"]
+
+
+def test_stats(executor: HashExecutor) -> None:
+    recorder = _Recorder()
+    executor.submit(Priority.SIGNUP, recorder.block)
+    future = executor.submit(Priority.BATCH, recorder.record, "batch")
+
+    stats = executor.stats()
+    assert stats[Priority.BATCH].queue_depth == 1
+    assert stats[Priority.BATCH].submitted == 1
+    assert stats[Priority.BATCH].completed == 0
+
+    recorder.gate.set()
+    future.result()
+    executor.shutdown()
+
+    stats = executor.stats()
+    assert stats[Priority.BATCH].queue_depth == 0
+    assert stats[Priority.BATCH].running == 0
+    assert stats[Priority.BATCH].completed == 1
+    assert stats[Priority.BATCH].latency_max >= stats[Priority.BATCH].wait_time_max
+    assert stats[Priority.BATCH].latency_p99 > 0
+    assert stats[Priority.INTERACTIVE].submitted == 0
+    assert stats[Priority.INTERACTIVE].latency_avg == 0
+
+
+def test_cancelled_task_is_skipped(executor: HashExecutor) -> None:
+    recorder = _Recorder()
+    executor.submit(Priority.BATCH, recorder.block)
+    cancelled = executor.submit(Priority.BATCH, recorder.record, "cancelled")
+    future = executor.submit(Priority.BATCH, recorder.record, "kept")
+    assert cancelled.cancel()
+    recorder.gate.set()
+    future.result()
+    assert recorder.order == ["kept"]
+
+
+def test_submit_after_shutdown(executor: HashExecutor) -> None:
+    executor.shutdown()
+    with pytest.raises(exceptions.ExecutorShutdownError):
+        executor.submit(Priority.INTERACTIVE, pow, 2, 10)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"max_workers": 0}, id="max_workers"),
+        pytest.param({"weights": {Priority.BATCH: 0}}, id="weight"),
+        pytest.param({"weights": {Priority.INTERACTIVE: 1}}, id="interactive"),
+        pytest.param({"max_wait": 0}, id="max_wait"),
+    ],
+)
+def test_invalid_configuration(kwargs: dict) -> None:
+    with pytest.raises(AssertionError):
+        HashExecutor(**kwargs)
@@ -1,6 +1,9 @@
+import asyncio
+import collections.abc
+
 import pytest
 
-from pwdlib import PasswordHash, exceptions
+from pwdlib import HashExecutor, PasswordHash, Priority, exceptions
 from pwdlib.hashers.argon2 import Argon2Hasher
 from pwdlib.hashers.bcrypt import BcryptHasher
 
@@ -101,3 +104,85 @@ def test_invalid_type(invalid_value: object, password_hash: PasswordHash) -> Non
         password_hash.verify_and_update(invalid_value, _ARGON2_HASH_STR)  # type: ignore[arg-type]
     with pytest.raises(TypeError, match="hash must be str or bytes"):
         password_hash.verify_and_update(_PASSWORD, invalid_value)  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def executor_password_hash() -> collections.abc.Iterator[PasswordHash]:
+    with HashExecutor(2) as executor:
+        yield PasswordHash((Argon2Hasher(), BcryptHasher()), executor=executor)
+
+
+def test_executor_priorities(executor_password_hash: PasswordHash) -> None:
+    hash = executor_password_hash.hash(_PASSWORD, priority=Priority.BATCH)
+    assert executor_password_hash.verify(_PASSWORD, hash, priority=Priority.INTERACTIVE)
+    valid, updated_hash = executor_password_hash.verify_and_update(
+        _PASSWORD,
+        _BCRYPT_HASH_STR,
+        priority=Priority.SIGNUP,
+        rehash_priority=Priority.BATCH,
+    )
+    assert valid is True
+    assert updated_hash is not None
+
+    assert executor_password_hash.executor is not None
+    stats = executor_password_hash.executor.stats()
+    assert stats[Priority.INTERACTIVE].completed == 1
+    assert stats[Priority.SIGNUP].completed == 1
+    assert stats[Priority.BATCH].completed == 2
+    assert stats[Priority.REHASH].completed == 0
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_async(
+    use_executor: bool,
+    password_hash: PasswordHash,
+    executor_password_hash: PasswordHash,
+) -> None:
+    instance = executor_password_hash if use_executor else password_hash
+
+    async def _run() -> None:
+        hash = await instance.ahash(_PASSWORD)
+        assert instance.current_hasher.identify(hash)
+        assert await instance.averify(_PASSWORD, hash) is True
+        assert await instance.averify("INVALID_PASSWORD", hash) is False
+        assert await instance.averify_and_update(_PASSWORD, hash) == (True, None)
+        assert await instance.averify_and_update("INVALID_PASSWORD", hash) == (
+            False,
+            None,
+        )
+        valid, updated_hash = await instance.averify_and_update(
+            _PASSWORD, _BCRYPT_HASH_STR, priority=Priority.SIGNUP
+        )
+        assert valid is True
+        assert updated_hash is not None
+        with pytest.raises(exceptions.UnknownHashError):
+            await instance.averify(_PASSWORD, "INVALID_HASH")
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_batch(
+    use_executor: bool,
+    password_hash: PasswordHash,
+    executor_password_hash: PasswordHash,
+) -> None:
+    instance = executor_password_hash if use_executor else password_hash
+
+    hashes = instance.hash_many([_PASSWORD, "INVALID_PASSWORD"])
+    assert len(hashes) == 2
+    assert all(instance.current_hasher.identify(hash) for hash in hashes)
+
+    assert instance.verify_many(
+        [
+            (_PASSWORD, hashes[0]),
+            (_PASSWORD, hashes[1]),
+            (_PASSWORD, _BCRYPT_HASH_STR),
+        ],
+        priority=Priority.REHASH,
+    ) == [True, False, True]
+
+    with pytest.raises(exceptions.UnknownHashError):
+        instance.verify_many([(_PASSWORD, "INVALID_HASH")])
+    with pytest.raises(TypeError, match="password must be str or bytes"):
+        instance.hash_many([None])  # type: ignore[list-item]